@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import sys
+from functools import lru_cache
 from typing import TYPE_CHECKING, Awaitable, Callable, Type, TypeVar
 
 import rich.repr
-from rich.style import Style
+from rich.style import NULL_STYLE, Style
 
 from ._types import MessageTarget
 from .geometry import Offset, Size
@@ -22,6 +24,8 @@ if TYPE_CHECKING:
 class Event(Message):
     """The base class for all events."""
 
+    __slots__: list[str] = []
+
     def __rich_repr__(self) -> rich.repr.Result:
         yield from ()
 
@@ -41,13 +45,15 @@ class Callback(Event, bubble=False, verbose=True):
 class InvokeCallbacks(Event, bubble=False, verbose=True):
     """Sent after the Screen is updated"""
 
+    __slots__: list[str] = []
+
 
 class ShutdownRequest(Event):
-    pass
+    __slots__: list[str] = []
 
 
 class Shutdown(Event):
-    pass
+    __slots__: list[str] = []
 
 
 class Load(Event, bubble=False):
@@ -60,6 +66,8 @@ class Load(Event, bubble=False):
 
     """
 
+    __slots__: list[str] = []
+
 
 class Idle(Event, bubble=False):
     """Sent when there are no more items in the message queue.
@@ -69,6 +77,8 @@ class Idle(Event, bubble=False):
 
     """
 
+    __slots__: list[str] = []
+
 
 class Action(Event):
     __slots__ = ["action"]
@@ -117,18 +127,26 @@ class Resize(Event, bubble=False):
 class Compose(Event, bubble=False, verbose=True):
     """Sent to a widget to request it to compose and mount children."""
 
+    __slots__: list[str] = []
+
 
 class Mount(Event, bubble=False, verbose=False):
     """Sent when a widget is *mounted* and may receive messages."""
 
+    __slots__: list[str] = []
+
 
 class Unmount(Mount, bubble=False, verbose=False):
     """Sent when a widget is unmounted and may not longer receive messages."""
 
+    __slots__: list[str] = []
+
 
 class Show(Event, bubble=False):
     """Sent when a widget has become visible."""
 
+    __slots__: list[str] = []
+
 
 class Hide(Event, bubble=False):
     """Sent when a widget has been hidden.
@@ -138,10 +156,14 @@ class Hide(Event, bubble=False):
 
     """
 
+    __slots__: list[str] = []
+
 
 class Ready(Event, bubble=False):
     """Sent to the app when the DOM is ready."""
 
+    __slots__: list[str] = []
+
 
 @rich.repr.auto
 class MouseCapture(Event, bubble=False):
@@ -184,6 +206,8 @@ class MouseRelease(Event, bubble=False):
 class InputEvent(Event):
     """Base class for input events."""
 
+    __slots__: list[str] = []
+
 
 @rich.repr.auto
 class Key(InputEvent):
@@ -202,6 +226,8 @@ class Key(InputEvent):
 
     def __init__(self, sender: MessageTarget, key: str, character: str | None) -> None:
         super().__init__(sender)
+        # str.__str__ gives a plain str for Keys members and other str subclasses
+        key = sys.intern(str.__str__(key))
         self.key = key
         self.character = (
             (key if len(key) == 1 else None) if character is None else character
@@ -235,6 +261,7 @@ class Key(InputEvent):
         return False if self.character is None else self.character.isprintable()
 
 
+@lru_cache(maxsize=1024)
 def _key_to_identifier(key: str) -> str:
     """Convert the key string to a name suitable for use as a Python identifier."""
     if len(key) == 1 and key.isupper():
@@ -302,7 +329,7 @@ class MouseEvent(InputEvent, bubble=True):
         self.ctrl = ctrl
         self.screen_x = x if screen_x is None else screen_x
         self.screen_y = y if screen_y is None else screen_y
-        self._style = style or Style()
+        self._style = style or NULL_STYLE
 
     @classmethod
     def from_event(cls: Type[MouseEventT], event: MouseEvent) -> MouseEventT:
@@ -368,7 +395,7 @@ class MouseEvent(InputEvent, bubble=True):
     @property
     def style(self) -> Style:
         """The (Rich) Style under the cursor."""
-        return self._style or Style()
+        return self._style or NULL_STYLE
 
     @style.setter
     def style(self, style: Style) -> None:
@@ -408,34 +435,36 @@ class MouseEvent(InputEvent, bubble=True):
 class MouseMove(MouseEvent, bubble=False, verbose=True):
     """Sent when the mouse cursor moves."""
 
+    __slots__: list[str] = []
+
 
 @rich.repr.auto
 class MouseDown(MouseEvent, bubble=True, verbose=True):
-    pass
+    __slots__: list[str] = []
 
 
 @rich.repr.auto
 class MouseUp(MouseEvent, bubble=True, verbose=True):
-    pass
+    __slots__: list[str] = []
 
 
 @rich.repr.auto
 class MouseScrollDown(MouseEvent, bubble=True):
-    pass
+    __slots__: list[str] = []
 
 
 @rich.repr.auto
 class MouseScrollUp(MouseEvent, bubble=True):
-    pass
+    __slots__: list[str] = []
 
 
 class Click(MouseEvent, bubble=True):
-    pass
+    __slots__: list[str] = []
 
 
 @rich.repr.auto
 class Timer(Event, bubble=False, verbose=True):
-    __slots__ = ["time", "count", "callback"]
+    __slots__ = ["timer", "time", "count", "callback"]
 
     def __init__(
         self,
@@ -457,27 +486,27 @@ class Timer(Event, bubble=False, verbose=True):
 
 
 class Enter(Event, bubble=False, verbose=True):
-    pass
+    __slots__: list[str] = []
 
 
 class Leave(Event, bubble=False, verbose=True):
-    pass
+    __slots__: list[str] = []
 
 
 class Focus(Event, bubble=False):
-    pass
+    __slots__: list[str] = []
 
 
 class Blur(Event, bubble=False):
-    pass
+    __slots__: list[str] = []
 
 
 class DescendantFocus(Event, bubble=True, verbose=True):
-    pass
+    __slots__: list[str] = []
 
 
 class DescendantBlur(Event, bubble=True, verbose=True):
-    pass
+    __slots__: list[str] = []
 
 
 @rich.repr.auto
@@ -501,8 +530,8 @@ class Paste(Event, bubble=True):
 
 
 class ScreenResume(Event, bubble=False):
-    pass
+    __slots__: list[str] = []
 
 
 class ScreenSuspend(Event, bubble=False):
-    pass
+    __slots__: list[str] = []
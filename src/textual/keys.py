@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 import unicodedata
 from enum import Enum
 
@@ -197,6 +198,13 @@ class Keys(str, Enum):
     ShiftControlEnd = ControlShiftEnd
 
 
+# Intern the key values, so that comparisons with the keys of Key events
+# may short-circuit on identity.
+for _key in Keys:
+    sys.intern(_key.value)
+del _key
+
+
 # Unicode db contains some obscure names
 # This mapping replaces them with more common terms
 KEY_NAME_REPLACEMENTS = {
@@ -38,6 +38,7 @@ class Message:
     verbose: ClassVar[bool] = False  # Message is verbose
     no_dispatch: ClassVar[bool] = False  # Message may not be handled by client code
     namespace: ClassVar[str] = ""  # Namespace to disambiguate messages
+    _snake_name: ClassVar[str] = "message"  # Class name in snake case
 
     def __init__(self, sender: MessageTarget) -> None:
         self.sender: MessageTarget = sender
@@ -46,7 +47,7 @@ class Message:
         self._forwarded = False
         self._no_default_action = False
         self._stop_propagation = False
-        name = camel_to_snake(self.__class__.__name__)
+        name = self._snake_name
         self._handler_name = (
             f"on_{self.namespace}_{name}" if self.namespace else f"on_{name}"
         )
@@ -63,6 +64,7 @@ class Message:
         namespace: str | None = None,
     ) -> None:
         super().__init_subclass__()
+        cls._snake_name = camel_to_snake(cls.__name__)
         if bubble is not None:
             cls.bubble = bubble
         cls.verbose = verbose
@@ -1590,9 +1590,12 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         meta = event.style.meta
         if meta and self.show_cursor and self.cursor_type != "none":
             try:
-                self.hover_coordinate = Coordinate(meta["row"], meta["column"])
+                hover_coordinate = Coordinate(meta["row"], meta["column"])
             except KeyError:
                 pass
+            else:
+                if hover_coordinate != self.hover_coordinate:
+                    self.hover_coordinate = hover_coordinate
 
     def _get_fixed_offset(self) -> Spacing:
         """Calculate the "fixed offset", that is the space to the top and left
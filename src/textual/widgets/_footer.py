@@ -74,7 +74,9 @@ class Footer(Widget):
 
     async def on_mouse_move(self, event: events.MouseMove) -> None:
         """Store any key we are moving over."""
-        self.highlight_key = event.style.meta.get("key")
+        key = event.style.meta.get("key")
+        if key != self.highlight_key:
+            self.highlight_key = key
 
     async def on_leave(self, event: events.Leave) -> None:
         """Clear any highlight when the mouse leaves the widget"""
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, ClassVar, Generic, Iterable, NewType, TypeVar, cast
 
 import rich.repr
@@ -10,7 +10,6 @@ from rich.text import Text, TextType
 from .. import events
 from .._cache import LRUCache
 from .._immutable_sequence_view import ImmutableSequenceView
-from .._loop import loop_last
 from .._segment_tools import line_pad
 from .._types import MessageTarget
 from ..binding import Binding, BindingType
@@ -36,12 +35,21 @@ TOGGLE_STYLE = Style.from_meta({"toggle": True})
 class _TreeLine(Generic[TreeDataType]):
     path: list[TreeNode[TreeDataType]]
     last: bool
+    _meta_style: Style | None = field(default=None, init=False, repr=False)
 
     @property
     def node(self) -> TreeNode[TreeDataType]:
         """TreeNode: The node associated with this line."""
         return self.path[-1]
 
+    @property
+    def meta_style(self) -> Style:
+        """Style: A style with the meta that identifies the node and line."""
+        if self._meta_style is None:
+            node = self.node
+            self._meta_style = Style(meta={"node": node._id, "line": node._line})
+        return self._meta_style
+
     def _get_guide_width(self, guide_depth: int, show_root: bool) -> int:
         """Get the cell width of the line as rendered.
 
@@ -93,6 +101,7 @@ class TreeNode(Generic[TreeDataType]):
         self._allow_expand = allow_expand
         self._updates: int = 0
         self._line: int = -1
+        self._label_width: tuple[int, int] | None = None
 
     def __rich_repr__(self) -> rich.repr.Result:
         yield self._label.plain
@@ -111,6 +120,8 @@ class TreeNode(Generic[TreeDataType]):
     @property
     def line(self) -> int:
         """int: Get the line number for this node, or -1 if it is not displayed."""
+        # Accessing the tree lines will rebuild them if required
+        self._tree._tree_lines
         return self._line
 
     @property
@@ -173,11 +184,13 @@ class TreeNode(Generic[TreeDataType]):
         Args:
             expand_all: If `True` expand all offspring at all depths.
         """
-        self._expanded = True
-        self._updates += 1
-        if expand_all:
-            for child in self.children:
-                child._expand(expand_all)
+        nodes = [self]
+        while nodes:
+            node = nodes.pop()
+            node._expanded = True
+            node._updates += 1
+            if expand_all:
+                nodes.extend(node._children)
 
     def expand(self) -> None:
         """Expand the node (show its children)."""
@@ -195,11 +208,13 @@ class TreeNode(Generic[TreeDataType]):
         Args:
             collapse_all: If `True` collapse all offspring at all depths.
         """
-        self._expanded = False
-        self._updates += 1
-        if collapse_all:
-            for child in self.children:
-                child._collapse(collapse_all)
+        nodes = [self]
+        while nodes:
+            node = nodes.pop()
+            node._expanded = False
+            node._updates += 1
+            if collapse_all:
+                nodes.extend(node._children)
 
     def collapse(self) -> None:
         """Collapse the node (hide its children)."""
@@ -486,6 +501,7 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
         self._line_cache: LRUCache[LineCacheKey, Strip] = LRUCache(1024)
         self._tree_lines_cached: list[_TreeLine] | None = None
         self._cursor_node: TreeNode[TreeDataType] | None = None
+        self._guides_cache: dict[tuple, tuple[str, str, str, str]] = {}
 
     @property
     def cursor_node(self) -> TreeNode[TreeDataType] | None:
@@ -555,8 +571,9 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
     def get_label_width(self, node: TreeNode[TreeDataType]) -> int:
         """Get the width of the nodes label.
 
-        The default behavior is to call `render_node` and return the cell length. This method may be
-        overridden in a sub-class if it can be done more efficiently.
+        The default behavior is to call `render_node` and return the cell length, which is
+        cached until the node is updated. This method may be overridden in a sub-class if it
+        can be done more efficiently.
 
         Args:
             node: A node.
@@ -564,12 +581,20 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
         Returns:
             Width in cells.
         """
+        cached_width = node._label_width
+        if cached_width is not None and cached_width[0] == node._updates:
+            return cached_width[1]
         label = self.render_label(node, NULL_STYLE, NULL_STYLE)
+        node._label_width = (node._updates, label.cell_len)
         return label.cell_len
 
     def clear(self) -> None:
         """Clear all nodes under root."""
         self._line_cache.clear()
+        if self._tree_lines_cached is not None:
+            # The removed nodes must not keep a line from the old tree
+            for tree_line in self._tree_lines_cached:
+                tree_line.node._line = -1
         self._tree_lines_cached = None
         self._current_id = 0
         root_label = self.root._label
@@ -602,7 +627,7 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
         Args:
             node: A tree node, or None to reset cursor.
         """
-        self.cursor_line = -1 if node is None else node._line
+        self.cursor_line = -1 if node is None else node.line
 
     def get_node_at_line(self, line_no: int) -> TreeNode[TreeDataType] | None:
         """Get the node for a given line.
@@ -650,7 +675,15 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
 
     def _invalidate(self) -> None:
         """Invalidate caches."""
+        if self._tree_lines_cached is None:
+            # Already invalidated and nothing has been rendered since, so there is
+            # nothing more to do until the lines are rebuilt. This coalesces the
+            # invalidations from adding many nodes in one go.
+            return
         self._line_cache.clear()
+        # Nodes which are no longer visible after the rebuild must not keep a stale line
+        for tree_line in self._tree_lines_cached:
+            tree_line.node._line = -1
         self._tree_lines_cached = None
         self._updates += 1
         self.root._reset()
@@ -659,9 +692,12 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
     def _on_mouse_move(self, event: events.MouseMove):
         meta = event.style.meta
         if meta and "line" in meta:
-            self.hover_line = meta["line"]
+            hover_line = meta["line"]
         else:
-            self.hover_line = -1
+            hover_line = -1
+        # Most mouse moves stay on the same line, so skip the reactive machinery
+        if hover_line != self.hover_line:
+            self.hover_line = hover_line
 
     def _new_id(self) -> NodeID:
         """Create a new node ID.
@@ -671,7 +707,8 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
         """
         id = self._current_id
         self._current_id += 1
-        return NodeID(id)
+        # NodeID only exists for the type checker, so avoid calling it at runtime
+        return id  # type: ignore[return-value]
 
     def _get_node(self, line: int) -> TreeNode[TreeDataType] | None:
         try:
@@ -751,7 +788,7 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
         Args:
             node: Node to scroll in to view.
         """
-        line = node._line
+        line = node.line
         if line != -1:
             self.scroll_to_line(line)
 
@@ -775,12 +812,24 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
         Args:
             node: A tree node.
         """
+        tree_lines = self._tree_lines
+        node_line = node._line
+        if (
+            not 0 <= node_line < len(tree_lines)
+            or tree_lines[node_line].node is not node
+        ):
+            return
+        depth = len(tree_lines[node_line].path) - 1
         scroll_y = self.scroll_offset.y
         height = self.size.height
-        visible_lines = self._tree_lines[scroll_y : scroll_y + height]
-        for line_no, line in enumerate(visible_lines, scroll_y):
-            if node in line.path:
-                self.refresh_line(line_no)
+        # The node's descendants are on the lines directly beneath it
+        for line_no in range(
+            max(node_line, scroll_y), min(scroll_y + height, len(tree_lines))
+        ):
+            path = tree_lines[line_no].path
+            if len(path) <= depth or path[depth] is not node:
+                break
+            self.refresh_line(line_no)
 
     @property
     def _tree_lines(self) -> list[_TreeLine]:
@@ -803,21 +852,24 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
 
         root = self.root
 
-        def add_node(
-            path: list[TreeNode[TreeDataType]], node: TreeNode[TreeDataType], last: bool
-        ) -> None:
+        # Depth first traversal, with nodes pushed in reverse so they pop in order
+        stack: list[tuple[list[TreeNode[TreeDataType]], TreeNode[TreeDataType], bool]]
+        if self.show_root:
+            stack = [([], root, True)]
+        else:
+            stack = [([], node, True) for node in reversed(root._children)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            path, node, last = pop()
             child_path = [*path, node]
             node._line = len(lines)
             add_line(TreeLine(child_path, last))
-            if node._expanded:
-                for last, child in loop_last(node._children):
-                    add_node(child_path, child, last)
-
-        if self.show_root:
-            add_node([], root, True)
-        else:
-            for node in self.root._children:
-                add_node([], node, True)
+            if node._expanded and node._children:
+                children = node._children
+                last_child = children[-1]
+                for child in reversed(children):
+                    push((child_path, child, child is last_child))
         self._tree_lines_cached = lines
 
         guide_depth = self.guide_depth
@@ -836,7 +888,7 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
 
         self.virtual_size = Size(width, len(lines))
         if self.cursor_line != -1:
-            if self.cursor_node is not None:
+            if self.cursor_node is not None and self.cursor_node._line != -1:
                 self.cursor_line = self.cursor_node._line
             if self.cursor_line >= len(lines):
                 self.cursor_line = -1
@@ -897,6 +949,16 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
                 Returns:
                     Strings for space, vertical, terminator and cross.
                 """
+                guides_key = (
+                    self.show_guides,
+                    self.guide_depth,
+                    style.bold,
+                    style.underline2,
+                )
+                cached_guides = self._guides_cache.get(guides_key)
+                if cached_guides is not None:
+                    return cached_guides
+
                 lines: tuple[Iterable[str], Iterable[str], Iterable[str], Iterable[str]]
                 if self.show_guides:
                     lines = self.LINES["default"]
@@ -912,7 +974,9 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
                     f"{characters[0]}{characters[1] * guide_depth} "
                     for characters in lines
                 )
-                return cast("tuple[str, str, str, str]", guide_lines)
+                guide_strings = cast("tuple[str, str, str, str]", guide_lines)
+                self._guides_cache[guides_key] = guide_strings
+                return guide_strings
 
             if is_hover:
                 line_style = self.get_component_rich_style("tree--highlight-line")
@@ -954,7 +1018,7 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
                 )
 
             label = self.render_label(line.path[-1], line_style, label_style).copy()
-            label.stylize(Style(meta={"node": line.node._id, "line": y}))
+            label.stylize(line.meta_style)
             guides.append(label)
 
             segments = list(guides.render(self.app.console))
@@ -1013,16 +1077,14 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
 
     def action_page_down(self) -> None:
         """Move the cursor down a page's-worth of nodes."""
-        if self.cursor_line == -1:
-            self.cursor_line = 0
-        self.cursor_line += self.scrollable_content_region.height - 1
+        cursor_line = 0 if self.cursor_line == -1 else self.cursor_line
+        self.cursor_line = cursor_line + self.scrollable_content_region.height - 1
         self.scroll_to_line(self.cursor_line)
 
     def action_page_up(self) -> None:
         """Move the cursor up a page's-worth of nodes."""
-        if self.cursor_line == -1:
-            self.cursor_line = self.last_line
-        self.cursor_line -= self.scrollable_content_region.height - 1
+        cursor_line = self.last_line if self.cursor_line == -1 else self.cursor_line
+        self.cursor_line = cursor_line - (self.scrollable_content_region.height - 1)
         self.scroll_to_line(self.cursor_line)
 
     def action_scroll_home(self) -> None:
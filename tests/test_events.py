@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+
+from textual import events
+
+LIFECYCLE_EVENTS = [
+    events.Event,
+    events.ShutdownRequest,
+    events.Shutdown,
+    events.Load,
+    events.Idle,
+    events.Mount,
+    events.Unmount,
+]
+
+STATELESS_EVENTS = [
+    events.InvokeCallbacks,
+    events.Compose,
+    events.Show,
+    events.Hide,
+    events.Ready,
+    events.Enter,
+    events.Leave,
+    events.Focus,
+    events.Blur,
+    events.DescendantFocus,
+    events.DescendantBlur,
+    events.ScreenResume,
+    events.ScreenSuspend,
+]
+
+MOUSE_EVENTS = [
+    events.MouseEvent,
+    events.MouseMove,
+    events.MouseDown,
+    events.MouseUp,
+    events.MouseScrollDown,
+    events.MouseScrollUp,
+    events.Click,
+]
+
+
+@pytest.mark.parametrize("event_type", LIFECYCLE_EVENTS + STATELESS_EVENTS)
+def test_stateless_events_have_no_dict(event_type: type[events.Event]) -> None:
+    """Events without state of their own are slotted, so have no __dict__."""
+    event = event_type(None)
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(AttributeError):
+        event.foo = "bar"
+
+
+def test_timer_event_slots() -> None:
+    """Every attribute set by the Timer event must be in its slots."""
+    timer = object()
+    event = events.Timer(None, timer, 1.5, count=2)
+    assert not hasattr(event, "__dict__")
+    assert event.timer is timer
+    assert event.time == 1.5
+    assert event.count == 2
+    assert event.callback is None
+
+
+def test_key_event_has_no_dict() -> None:
+    """Key events are slotted, so have no __dict__."""
+    event = events.Key(None, "a", "a")
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(AttributeError):
+        event.foo = "bar"
+
+
+@pytest.mark.parametrize("event_type", MOUSE_EVENTS)
+def test_mouse_events_have_no_dict(event_type: type[events.MouseEvent]) -> None:
+    """Mouse events are slotted, so have no __dict__."""
+    event = event_type(None, 1, 2, 0, 0, 1, False, False, False)
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(AttributeError):
+        event.foo = "bar"
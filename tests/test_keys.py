@@ -1,7 +1,10 @@
+import sys
+
 import pytest
 
+from textual import events
 from textual.app import App
-from textual.keys import _character_to_key, _get_key_display
+from textual.keys import Keys, _character_to_key, _get_key_display
 
 
 @pytest.mark.parametrize(
@@ -52,3 +55,23 @@ async def test_character_bindings():
 
 def test_get_key_display():
     assert _get_key_display("minus") == "-"
+
+
+def test_key_event_key_is_interned():
+    """The key of a Key event should be the interned plain string."""
+    event = events.Key(None, Keys.ControlA, None)
+    assert type(event.key) is str
+    assert event.key is Keys.ControlA.value
+    assert events.Key(None, "".join(["ctrl", "+", "a"]), None).key is event.key
+
+
+def test_key_event_key_str_subclass():
+    """A str subclass key should be stored as the interned plain string."""
+
+    class KeyName(str):
+        pass
+
+    event = events.Key(None, KeyName("x"), None)
+    assert type(event.key) is str
+    assert event.key == "x"
+    assert event.key is sys.intern("x")
@@ -104,3 +104,34 @@ async def test_tree_node_toggle_all() -> None:
         while check_node.children:
             assert any(child.is_expanded for child in check_node.children) is False
             check_node = check_node.children[0]
+
+
+async def test_tree_node_line_after_collapse() -> None:
+    """Collapsing a node should remove the line from the nodes it hides."""
+    async with TreeApp().run_test() as pilot:
+        tree = pilot.app.query_one(Tree)
+        tree.root.expand_all()
+        trunk = tree.root.children[0]
+        child = trunk.children[0]
+        assert trunk.line == 1
+        assert child.line == 2
+        assert tree.root.children[1].line == 12
+        trunk.collapse()
+        assert trunk.line == 1
+        assert child.line == -1
+        assert tree.root.children[1].line == 2
+
+
+async def test_tree_node_line_after_clear() -> None:
+    """Clearing the tree should remove the line from the nodes it removes."""
+    async with TreeApp().run_test() as pilot:
+        tree = pilot.app.query_one(Tree)
+        tree.root.expand_all()
+        trunk = tree.root.children[0]
+        child = trunk.children[0]
+        assert trunk.line == 1
+        assert child.line == 2
+        tree.clear()
+        assert trunk.line == -1
+        assert child.line == -1
+        assert tree.root.line == 0
@@ -19,3 +19,12 @@ def test_tree_node_label_via_tree() -> None:
     assert node.label == Text("Facehugger")
     node.label = "Chestbuster"
     assert node.label == Text("Chestbuster")
+
+
+def test_tree_node_label_width() -> None:
+    """The label width should follow changes to a TreeNode's label."""
+    tree = Tree[None]("Xenomorph Lifecycle")
+    node = tree.root.add_leaf("Facehugger")
+    assert tree.get_label_width(node) == 10
+    node.label = "Chestbuster"
+    assert tree.get_label_width(node) == 11
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from textual.app import App, ComposeResult
+from textual.containers import Container
+from textual.widgets import Tree
+
+
+class TreeApp(App[None]):
+    """Test tree app."""
+
+    def compose(self) -> ComposeResult:
+        yield Container(Tree[None]("Root"))
+
+    def on_mount(self) -> None:
+        tree = self.query_one(Tree)
+        tree.root.add_leaf("One")
+        tree.root.add_leaf("Two")
+        tree.root.add_leaf("Three")
+        tree.root.expand()
+        tree.focus()
+
+
+async def test_hover_and_cursor_follow_style_changes() -> None:
+    """Hover and cursor lines should pick up inline and parent style changes."""
+    async with TreeApp().run_test() as pilot:
+        tree = pilot.app.query_one(Tree)
+        tree.hover_line = 1
+        tree.cursor_line = 1
+        await pilot.pause()
+        tree.render_line(1)
+
+        tree.styles.background = "red"
+        pilot.app.query_one(Container).styles.text_style = "italic"
+        tree.hover_line = 2
+        tree.cursor_line = 3
+        await pilot.pause()
+
+        hover_line = list(tree.render_line(2))
+        assert hover_line[-1].style.bgcolor.triplet == (255, 10, 10)
+        assert all(segment.style.italic for segment in hover_line)
+
+        cursor_line = list(tree.render_line(3))
+        assert cursor_line[-1].style.bgcolor.triplet == (255, 0, 0)
+        assert all(segment.style.italic for segment in cursor_line)